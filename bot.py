@@ -1,10 +1,14 @@
 # bot.py
 import os
+import asyncio
 import discord
 from discord.ext import commands
 from dotenv import load_dotenv
 import re
 from datetime import date
+from operator import itemgetter
+from collections import defaultdict, deque
+from itertools import islice
 
 load_dotenv()
 TOKEN = os.getenv('DISCORD_TOKEN')
@@ -26,6 +30,37 @@ async def on_ready():
 async def hello(ctx):
     await ctx.send(f"👋 Hello {ctx.author.display_name}! The bot is working!")
 
+# Allowed emoji per grid line — set difference is much cheaper than running
+# the regex engine over every line
+_CONN_SET = frozenset("🟨🟩🟦🟪")
+_STRANDS_SET = frozenset("🔵💡🟡")
+
+# Precompiled pattern for the Globle parse helper — avoids the re cache lookup
+_GLOBLE_GUESS_RE = re.compile(r"🟩\s*=\s*(\d+)")
+
+# Globe emojis that mark a Globle share — one isdisjoint scan instead of three `in` checks
+_GLOBE_CHARS = frozenset("🌎🌍🌏")
+
+# Connections point values per solve position — purple hardest, then blue,
+# green, yellow. Rows are zero-padded so indexing never needs a bounds check.
+_ZERO = (0,) * 8
+_BASE_POINTS = {
+    "🟪": (5, 3, 2, 1, 0, 0, 0, 0),
+    "🟦": (3, 2, 1, 0, 0, 0, 0, 0),
+    "🟩": (2, 1, 0, 0, 0, 0, 0, 0),
+    "🟨": _ZERO,
+}
+
+# Cache today's ISO string so we don't reformat the date on every message
+_today_cache = [None, None]  # [date_obj, iso_str]
+
+def today_iso():
+    d = date.today()
+    if _today_cache[0] != d:
+        _today_cache[0] = d
+        _today_cache[1] = d.isoformat()
+    return _today_cache[1]
+
 # Data storage for daily results
 daily_scores = {
     "wordle": {},
@@ -40,29 +75,27 @@ def parse_connections_result(content):
     Parses a pasted NYT Connections result made of emoji squares.
     Returns a tuple: (mistakes, points, summary)
     """
-    lines = content.splitlines()
-    grid_lines = [l for l in lines if re.match(r"^[🟨🟩🟦🟪]+$", l.strip())]
+    # A real share is tiny — don't grind through arbitrarily long pastes
+    if len(content) > 4096:
+        return 0, 0, ""
+
+    grid_lines = []
+    for l in content.splitlines():
+        s = l.strip()
+        if s and not (set(s) - _CONN_SET):
+            grid_lines.append(s)
+            if len(grid_lines) > 20:  # way past any legit grid + mistakes
+                break
 
     # Each valid 4-line block = 1 solved color group, extra lines = mistakes
     mistakes = max(0, len(grid_lines) - 4)
 
     # Get color order as list of unique colors in sequence
-    color_order = []
-    for line in grid_lines:
-        color = line[0]
-        if color not in color_order:
-            color_order.append(color)
-
-    # Assign difficulty-based point values
-    # Purple hardest, then Blue, then Green, then Yellow
-    base_points = {"🟪": [5, 3, 2, 1], "🟦": [3, 2, 1, 0], "🟩": [2, 1, 0, 0], "🟨": [0, 0, 0, 0]}
-
-    points = 0
-    for idx, color in enumerate(color_order):
-        if color in base_points:
-            # If solved earlier (lower idx), more bonus
-            if idx < len(base_points[color]):
-                points += base_points[color][idx]
+    # (dict.fromkeys dedupes in order without list membership scans)
+    color_order = list(dict.fromkeys(line[0] for line in grid_lines))
+
+    # Solved earlier (lower idx) = more bonus; the padded rows make this branchless
+    points = sum(_BASE_POINTS.get(color, _ZERO)[idx] for idx, color in enumerate(color_order))
 
     # Build a readable summary for the leaderboard
     summary = ""
@@ -84,8 +117,17 @@ def parse_strands_result(content):
     Parses NYT Strands emoji results.
     Returns (score, summary)
     """
-    lines = content.splitlines()
-    grid_lines = [l for l in lines if re.match(r"^[🔵💡🟡]+$", l.strip())]
+    # A real share is tiny — don't grind through arbitrarily long pastes
+    if len(content) > 4096:
+        return 0, "No recognizable Strands result."
+
+    grid_lines = []
+    for l in content.splitlines():
+        s = l.strip()
+        if s and not (set(s) - _STRANDS_SET):
+            grid_lines.append(s)
+            if len(grid_lines) > 20:  # way past any legit result
+                break
 
     if not grid_lines:
         return 0, "No recognizable Strands result."
@@ -93,28 +135,33 @@ def parse_strands_result(content):
     # Flatten all emojis into a sequence
     sequence = "".join(grid_lines)
 
-    correct_count = sequence.count("🔵")
-    hints = sequence.count("💡")
-    spangram_positions = [i for i, ch in enumerate(sequence) if ch == "🟡"]
+    # Tally everything in a single pass over the sequence
+    correct_count = 0
+    hints = 0
+    spangram_positions = []
+    for i, ch in enumerate(sequence):
+        if ch == "🔵":
+            correct_count += 1
+        elif ch == "💡":
+            hints += 1
+        elif ch == "🟡":
+            spangram_positions.append(i)
 
     # Base points
     score = correct_count + (len(spangram_positions) * 5) - (hints * 2)
 
+    # Make a human-readable summary
+    summary = f"{correct_count} correct, {hints} hint{'s' if hints != 1 else ''}"
+
     # Spangram bonuses — earlier = higher reward
     if spangram_positions:
         first_pos = spangram_positions[0]
         total_len = len(sequence)
         if first_pos < total_len / 3:
             score += 3
+            summary += ", spangram early 🟡"
         elif first_pos < (2 * total_len / 3):
             score += 1
-
-    # Make a human-readable summary
-    summary = f"{correct_count} correct, {hints} hint{'s' if hints != 1 else ''}"
-    if spangram_positions:
-        if spangram_positions[0] < len(sequence) / 3:
-            summary += ", spangram early 🟡"
-        elif spangram_positions[0] < (2 * len(sequence) / 3):
             summary += ", spangram mid 🟡"
         else:
             summary += ", spangram late 🟡"
@@ -126,15 +173,17 @@ def parse_globle_result(content):
     """
     Returns (guesses, summary)
     """
-    lines = content.splitlines()
-
-    # Find the line with the green square 🟩 — it contains the final guess count
-    guess_line = next((l for l in lines if "🟩" in l), None)
-    if not guess_line:
+    # Find the line with the green square 🟩 — it contains the final guess count.
+    # Slice it out directly instead of splitting the whole message into lines.
+    idx = content.find("🟩")
+    if idx < 0:
         return None, "No recognizable Globle result."
+    line_start = content.rfind("\n", 0, idx) + 1
+    line_end = content.find("\n", idx)
+    guess_line = content[line_start:] if line_end < 0 else content[line_start:line_end]
 
     # Extract the number after the final 🟩
-    match = re.search(r"🟩\s*=\s*(\d+)", guess_line)
+    match = _GLOBLE_GUESS_RE.search(guess_line)
     if not match:
         return None, "Could not find number of guesses."
 
@@ -153,94 +202,9 @@ def parse_globle_result(content):
     return guesses, summary
 
 
-@bot.event
-async def on_message(message):
-    if message.author == bot.user:
-        return
-
-    content = message.content.strip()
-    username = message.author.display_name
-    today = date.today().isoformat()
-
-    # --- WORDLE ---
-    if content.startswith("Wordle"):
-        try:
-            first_line = content.splitlines()[0]
-            parts = first_line.split()
-            if len(parts) >= 3 and "/" in parts[2]:
-                score = int(parts[2].split("/")[0])
-                if today not in daily_scores["wordle"]:
-                    daily_scores["wordle"][today] = {}
-                daily_scores["wordle"][today][username] = score
-
-        except Exception as e:
-            print("Error parsing Wordle:", e)
-
-    # --- CONNECTIONS ---
-    elif content.lower().startswith("connections"):
-        try:
-            mistakes, points, summary = parse_connections_result(content)
-            if today not in daily_scores["connections"]:
-                daily_scores["connections"][today] = {}
-            daily_scores["connections"][today][username] = {
-                "mistakes": mistakes,
-                "points": points,
-                "summary": summary,
-            }
-
-        except Exception as e:
-            print("Error parsing Connections result:", e)
-
-
-            # --- STRANDS ---
-    elif content.lower().startswith("strands"):
-        try:
-            score, summary = parse_strands_result(content)
-            today = date.today().isoformat()
-            username = message.author.display_name
-
-            if today not in daily_scores["strands"]:
-                daily_scores["strands"][today] = {}
-
-            daily_scores["strands"][today][username] = {
-                "score": score,
-                "summary": summary,
-            }
-
-        except Exception as e:
-            print("Error parsing Strands result:", e)
-
-    # --- GLOBLE ---
-    elif "🌎" in content or "🌍" in content or "🌏" in content:
-        try:
-            guesses, summary = parse_globle_result(content)
-            if guesses is None:
-                return  # Not a valid result line
-
-            today = date.today().isoformat()
-            username = message.author.display_name
-
-            if today not in daily_scores.get("globle", {}):
-                daily_scores.setdefault("globle", {})[today] = {}
-
-            daily_scores["globle"][today][username] = {
-                "guesses": guesses,
-                "summary": summary,
-            }
-
-            # await message.channel.send(
-            #     f"🌎 Got your Globle result, {username}! {summary}"
-            # )
-        except Exception as e:
-            print("Error parsing Globle result:", e)
-
-
-    await bot.process_commands(message)
-
-
 # @bot.command()
 # async def leaderboard(ctx):
-#     today = date.today().isoformat()
+#     today = today_iso()
 
 #     wordle_data = daily_scores["wordle"].get(today, {})
 #     connections_data = daily_scores["connections"].get(today, {})
@@ -299,31 +263,198 @@ async def on_message(message):
 
 
 
-import json
+import msgspec
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 
-SAVE_FILE = "scores.json"
+SAVE_FILE = "scores.json"  # legacy all-history file, still read on startup
+
+def _shard_path(day):
+    return f"scores-{day}.json"
+
+# --- Score record types ---
+# Fixed-slot structs instead of three-key dicts: far less memory per entry
+# and much faster JSON (de)serialization via msgspec. Wordle stays a bare int.
+class ConnectionsEntry(msgspec.Struct):
+    mistakes: int
+    points: int
+    summary: str
+
+class StrandsEntry(msgspec.Struct):
+    score: int
+    summary: str
+
+class GlobleEntry(msgspec.Struct):
+    guesses: int
+    summary: str
+
+_ENTRY_TYPES = {
+    "wordle": int,
+    "connections": ConnectionsEntry,
+    "strands": StrandsEntry,
+    "globle": GlobleEntry,
+}
+
+# Entry types differ per game, so decode the outer mapping to Raw first and
+# finish each game's table with its own typed decoder
+_json_encoder = msgspec.json.Encoder()
+_raw_decoder = msgspec.json.Decoder(dict[str, msgspec.Raw])
+_day_decoders = {g: msgspec.json.Decoder(dict[str, t]) for g, t in _ENTRY_TYPES.items()}
+_legacy_decoders = {g: msgspec.json.Decoder(dict[str, dict[str, t]]) for g, t in _ENTRY_TYPES.items()}
 
 # --- Load / Save JSON ---
 def load_scores():
+    scores = {
+        "wordle": {},
+        "connections": {},
+        "strands": {},
+        "globle": {},
+    }
+
+    # Merge the legacy single-file store if it's still around
     try:
-        with open(SAVE_FILE, "r") as f:
-            return json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
-        return {
-            "wordle": {},
-            "connections": {},
-            "strands": {},
-            "globle": {},
-        }
-
-def save_scores():
-    with open(SAVE_FILE, "w") as f:
-        json.dump(daily_scores, f, indent=2)
+        with open(SAVE_FILE, "rb") as f:
+            raw = _raw_decoder.decode(f.read())
+        for game, blob in raw.items():
+            dec = _legacy_decoders.get(game)
+            if dec:
+                scores.setdefault(game, {}).update(dec.decode(blob))
+    except (FileNotFoundError, msgspec.DecodeError):
+        pass
+
+    # Merge the per-day shards written since
+    for name in sorted(os.listdir(".")):
+        if not (name.startswith("scores-") and name.endswith(".json")):
+            continue
+        day = name[len("scores-"):-len(".json")]
+        try:
+            with open(name, "rb") as f:
+                raw = _raw_decoder.decode(f.read())
+            for game, blob in raw.items():
+                dec = _day_decoders.get(game)
+                if dec:
+                    entries = dec.decode(blob)
+                    if entries:
+                        scores.setdefault(game, {})[day] = entries
+        except msgspec.DecodeError:
+            continue
+
+    return scores
+
+def save_scores(day):
+    # Only the given day's entries changed, so only that shard gets rewritten —
+    # write cost stays O(one day) no matter how much history accumulates
+    day_scores = {game: table.get(day, {}) for game, table in daily_scores.items()}
+    with open(_shard_path(day), "wb") as f:
+        f.write(_json_encoder.encode(day_scores))
+
+# Days with unsaved changes, so on_message never blocks the event loop on disk
+# I/O; a scheduler job flushes pending days every few seconds instead. Tracking
+# the day (not just a bit) means entries recorded right before midnight still
+# get their own shard written after the date rolls over.
+_dirty_days = set()
+
+async def flush_scores():
+    while _dirty_days:
+        day = _dirty_days.pop()
+        try:
+            await asyncio.to_thread(save_scores, day)
+        except Exception as e:
+            # Keep the day dirty so the next interval retries the write
+            _dirty_days.add(day)
+            print(f"Error saving scores for {day}:", e)
+            break
 
 # Load any saved data on startup
 daily_scores = load_scores()
 
+# Alias the per-game tables once — the hot update/build paths then skip a
+# daily_scores[...] lookup on every hit
+wordle_scores = daily_scores["wordle"]
+connections_scores = daily_scores["connections"]
+strands_scores = daily_scores["strands"]
+globle_scores = daily_scores["globle"]
+
+# Per-user recent history, newest entry first — lets !stats read the last
+# week directly instead of scanning every stored day
+_user_history = defaultdict(lambda: deque(maxlen=64))
+
+def _record_history(username, game, day, entry):
+    # One row per (game, day): a resubmitted result replaces the earlier one
+    hist = _user_history[username]
+    for item in hist:
+        if item[0] == game and item[1] == day:
+            hist.remove(item)
+            break
+    hist.appendleft((game, day, entry))
+
+def _rebuild_user_history():
+    days = sorted({day for table in daily_scores.values() for day in table})
+    for day in days:
+        for game, table in daily_scores.items():
+            for username, entry in table.get(day, {}).items():
+                _user_history[username].appendleft((game, day, entry))
+
+_rebuild_user_history()
+
+# --- Per-game result handlers, each returns True if it recorded a score ---
+def handle_wordle(content, username, today):
+    try:
+        # Only the header line matters — slice it out instead of splitting
+        # the whole message (the share includes the emoji grid below)
+        nl = content.find("\n")
+        first_line = content if nl < 0 else content[:nl]
+        parts = first_line.split()
+        if len(parts) >= 3 and "/" in parts[2]:
+            score = int(parts[2].split("/")[0])
+            wordle_scores.setdefault(today, {})[username] = score
+            _record_history(username, "wordle", today, score)
+            return True
+    except Exception as e:
+        print("Error parsing Wordle:", e)
+    return False
+
+def handle_connections(content, username, today):
+    try:
+        mistakes, points, summary = parse_connections_result(content)
+        entry = ConnectionsEntry(mistakes=mistakes, points=points, summary=summary)
+        connections_scores.setdefault(today, {})[username] = entry
+        _record_history(username, "connections", today, entry)
+        return True
+    except Exception as e:
+        print("Error parsing Connections result:", e)
+    return False
+
+def handle_strands(content, username, today):
+    try:
+        score, summary = parse_strands_result(content)
+        entry = StrandsEntry(score=score, summary=summary)
+        strands_scores.setdefault(today, {})[username] = entry
+        _record_history(username, "strands", today, entry)
+        return True
+    except Exception as e:
+        print("Error parsing Strands result:", e)
+    return False
+
+def handle_globle(content, username, today):
+    try:
+        guesses, summary = parse_globle_result(content)
+        if guesses is not None:
+            entry = GlobleEntry(guesses=guesses, summary=summary)
+            globle_scores.setdefault(today, {})[username] = entry
+            _record_history(username, "globle", today, entry)
+            return True
+    except Exception as e:
+        print("Error parsing Globle result:", e)
+    return False
+
+# Dispatch on the first token of the message — one dict lookup instead of a
+# startswith chain that lowercases the whole message
+DISPATCH = {
+    "wordle": handle_wordle,
+    "connections": handle_connections,
+    "strands": handle_strands,
+}
+
 # --- Modified event to always save on new messages ---
 @bot.event
 async def on_message(message):
@@ -332,145 +463,117 @@ async def on_message(message):
 
     content = message.content.strip()
     username = message.author.display_name
-    today = date.today().isoformat()
-
-    updated = False  # track if we need to save
-
-    # --- WORDLE ---
-    if content.startswith("Wordle"):
-        try:
-            first_line = content.splitlines()[0]
-            parts = first_line.split()
-            if len(parts) >= 3 and "/" in parts[2]:
-                score = int(parts[2].split("/")[0])
-                daily_scores["wordle"].setdefault(today, {})[username] = score
-                updated = True
-        except Exception as e:
-            print("Error parsing Wordle:", e)
-
-    # --- CONNECTIONS ---
-    elif content.lower().startswith("connections"):
-        try:
-            mistakes, points, summary = parse_connections_result(content)
-            daily_scores["connections"].setdefault(today, {})[username] = {
-                "mistakes": mistakes,
-                "points": points,
-                "summary": summary,
-            }
-            updated = True
-        except Exception as e:
-            print("Error parsing Connections result:", e)
-
-    # --- STRANDS ---
-    elif content.lower().startswith("strands"):
-        try:
-            score, summary = parse_strands_result(content)
-            daily_scores["strands"].setdefault(today, {})[username] = {
-                "score": score,
-                "summary": summary,
-            }
-            updated = True
-        except Exception as e:
-            print("Error parsing Strands result:", e)
-
-    # --- GLOBLE ---
-    elif "🌎" in content or "🌍" in content or "🌏" in content:
-        try:
-            guesses, summary = parse_globle_result(content)
-            if guesses is not None:
-                daily_scores["globle"].setdefault(today, {})[username] = {
-                    "guesses": guesses,
-                    "summary": summary,
-                }
-                updated = True
-        except Exception as e:
-            print("Error parsing Globle result:", e)
+    today = today_iso()
+
+    first = content[:20].split(None, 1)[0].lower() if content else ""
+    handler = DISPATCH.get(first)
+    if handler:
+        updated = handler(content, username, today)
+    elif not _GLOBE_CHARS.isdisjoint(content):
+        # Globle shares don't start with the game name, so sniff for a globe
+        updated = handle_globle(content, username, today)
+    else:
+        updated = False
 
     if updated:
-        save_scores()
+        global _lb_version
+        _dirty_days.add(today)
+        _lb_version += 1
 
     await bot.process_commands(message)
 
 import random
 
+# Winner emojis — add more here anytime! Module-level tuple plus a bound
+# choice method off a private Random instance, so each leaderboard build
+# skips rebuilding the list and the shared random-module state
+_CELEB = ("👑", "🏆", "🥇", "🎉", "🔥", "✨", "🧩", "🧠", "🎊")
+_rand_choice = random.Random().choice
+
+# Leaderboard cache — every score write bumps the version, so rebuilding is
+# only needed when something actually changed since the last call
+_lb_version = 0
+_lb_cached = (None, None, "")  # (today, version, text)
+
 def build_leaderboard_text():
-    today = date.today().isoformat()
+    global _lb_cached
+    today = today_iso()
+
+    # Capture the version before reading any scores — on_message can bump it
+    # mid-build (this runs in a worker thread), and stamping the later version
+    # would cache text that predates that write
+    version = _lb_version
 
-    wordle_data = daily_scores["wordle"].get(today, {})
-    connections_data = daily_scores["connections"].get(today, {})
-    strands_data = daily_scores["strands"].get(today, {})
-    globle_data = daily_scores["globle"].get(today, {})
+    if (today, version) == _lb_cached[:2]:
+        return _lb_cached[2]
+
+    wordle_data = wordle_scores.get(today, {})
+    connections_data = connections_scores.get(today, {})
+    strands_data = strands_scores.get(today, {})
+    globle_data = globle_scores.get(today, {})
 
     msg_lines = [f"🏆 **Framily Daily Leaderboard ({today})**"]
 
-    celebratory_emojis = ["👑", "🏆", "🥇", "🎉","🔥", "✨", "🧩", "🧠", "🎊"]  # Add more here anytime!
+    # Pick the winner emoji once per leaderboard instead of once per section
+    top_prefix = _rand_choice(_CELEB) + " "
 
     # --- WORDLE ---
     if wordle_data:
-        sorted_wordle = sorted(wordle_data.items(), key=lambda x: x[1])
+        sorted_wordle = sorted(wordle_data.items(), key=itemgetter(1))
         msg_lines.append("\n**Wordle**")
-        for i, (name, score) in enumerate(sorted_wordle, start=1):
-            prefix = ""
-            encouragement = ""
-
-            # Add emoji for top scorer
-            if i == 1:
-                prefix = random.choice(celebratory_emojis) + " "
-
-            # Encouraging messages
-            if score <= 2:
-                encouragement = ", AMAZING!"
-            elif score <= 3:
-                encouragement = ", nice job!"
-
-            msg_lines.append(f"{i}. {prefix}**{name}** : {score}/6{encouragement}")
+        # extend with a generator — one C-level call per section, not one
+        # append per row (top scorer gets the emoji, low scores get praise)
+        msg_lines.extend(
+            f"{i}. {top_prefix if i == 1 else ''}**{name}** : {score}/6"
+            f"{', AMAZING!' if score <= 2 else ', nice job!' if score <= 3 else ''}"
+            for i, (name, score) in enumerate(sorted_wordle, start=1)
+        )
     else:
         msg_lines.append("\nNo Wordle scores today.")
 
     # --- CONNECTIONS ---
     if connections_data:
-        sorted_conn = sorted(
-            connections_data.items(),
-            key=lambda x: (x[1]["mistakes"], -x[1]["points"])
-        )
+        # Decorate with the sort key up front — itemgetter beats a lambda per compare
+        conn_items = [
+            (name, d.mistakes, -d.points, d)
+            for name, d in connections_data.items()
+        ]
+        conn_items.sort(key=itemgetter(1, 2))
         msg_lines.append("\n**Connections**")
-        for i, (name, data) in enumerate(sorted_conn, start=1):
-            prefix = ""
-            summary = data["summary"]
-
-            # Emoji for top player
-            if i == 1:
-                prefix = random.choice(celebratory_emojis) + " "
-
-            msg_lines.append(f"{i}. {prefix}**{name}** : {summary}")
+        msg_lines.extend(
+            f"{i}. {top_prefix if i == 1 else ''}**{name}** : {data.summary}"
+            for i, (name, _, _, data) in enumerate(conn_items, start=1)
+        )
     else:
         msg_lines.append("\nNo Connections scores today.")
 
     # --- STRANDS ---
     if strands_data:
-        sorted_strands = sorted(strands_data.items(), key=lambda x: -x[1]["score"])
+        strands_items = [(d.score, name, d) for name, d in strands_data.items()]
+        strands_items.sort(key=itemgetter(0), reverse=True)
         msg_lines.append("\n**Strands**")
-        for i, (name, data) in enumerate(sorted_strands, start=1):
-            prefix = ""
-            if i == 1:
-                prefix = random.choice(celebratory_emojis) + " "
-            msg_lines.append(f"{i}. {prefix}**{name}** : {data['summary']} (+{data['score']} pts)")
+        msg_lines.extend(
+            f"{i}. {top_prefix if i == 1 else ''}**{name}** : {data.summary} (+{score} pts)"
+            for i, (score, name, data) in enumerate(strands_items, start=1)
+        )
     else:
         msg_lines.append("\nNo Strands scores today.")
 
     # --- GLOBLE ---
     if globle_data:
-        sorted_globle = sorted(globle_data.items(), key=lambda x: x[1]["guesses"])
+        globle_items = [(d.guesses, name, d) for name, d in globle_data.items()]
+        globle_items.sort(key=itemgetter(0))
         msg_lines.append("\n**Globle**")
-        for i, (name, data) in enumerate(sorted_globle, start=1):
-            prefix = ""
-            if i == 1:
-                prefix = random.choice(celebratory_emojis) + " "
-            msg_lines.append(f"{i}. {prefix}**{name}** : {data['summary']}")
+        msg_lines.extend(
+            f"{i}. {top_prefix if i == 1 else ''}**{name}** : {data.summary}"
+            for i, (_, name, data) in enumerate(globle_items, start=1)
+        )
     else:
         msg_lines.append("\nNo Globle scores today.")
 
-    return "\n".join(msg_lines)
+    text = "\n".join(msg_lines)
+    _lb_cached = (today, version, text)
+    return text
 
 
 @bot.command()
@@ -478,38 +581,56 @@ async def stats(ctx, user: discord.Member = None):
     """Show personal stats for yourself or another user."""
     user = user or ctx.author
     username = user.display_name
-    total_scores = []
 
-    for game in daily_scores:
-        for day, results in daily_scores[game].items():
-            if username in results:
-                total_scores.append((game, day, results[username]))
+    # The write-time index already holds this user's history newest-first
+    recent = list(islice(_user_history[username], 7))
 
-    if not total_scores:
+    if not recent:
         await ctx.send(f"No stats found for **{username}**.")
         return
 
     lines = [f"📊 **Stats for {username}**"]
-    for game, day, entry in total_scores[-7:]:  # last 7 entries
+    for game, day, entry in reversed(recent[:7]):  # last 7 entries, oldest first
         lines.append(f"{day} — {game.title()}: {entry}")
     await ctx.send("\n".join(lines))
 
 # --- Scheduled leaderboard post ---
 scheduler = AsyncIOScheduler()
 
+# Replace CHANNEL_ID with your Discord channel ID
+CHANNEL_ID = 1029409485543977102
+
+async def _post_leaderboard():
+    channel = bot.get_channel(CHANNEL_ID)
+    if channel:
+        # Build off the event loop — with history this does real CPU work
+        text = await asyncio.to_thread(build_leaderboard_text)
+        await channel.send(text)
+
 @bot.event
 async def on_ready():
     print(f"✅ {bot.user} is online and ready!")
-    scheduler.start()
-
-    # Replace CHANNEL_ID with your Discord channel ID
-    channel = bot.get_channel(1029409485543977102)
-    if channel:
+    if not scheduler.running:
+        scheduler.start()
+
+    # Stable job ids + replace_existing so a reconnect-triggered on_ready
+    # can't stack duplicate jobs
+    scheduler.add_job(
+        flush_scores,
+        "interval",
+        seconds=5,
+        id="flush_scores",
+        replace_existing=True,
+    )
+
+    if bot.get_channel(CHANNEL_ID):
         scheduler.add_job(
-            lambda: channel.send(build_leaderboard_text()),
+            _post_leaderboard,
             "cron",
             hour=5,
             minute=0,
+            id="daily_leaderboard",
+            replace_existing=True,
         )
         print("⏰ Daily leaderboard scheduled for 5:00 AM.")
     else:
@@ -518,6 +639,7 @@ async def on_ready():
 
 @bot.command()
 async def leaderboard(ctx):
-    await ctx.send(build_leaderboard_text())
+    text = await asyncio.to_thread(build_leaderboard_text)
+    await ctx.send(text)
 
 bot.run(TOKEN)